@@ -1,20 +1,48 @@
-# Responsys API
-"""Below URLs and API version were last checked to be up to date on 11/3/2019.
-LOGIN_BASE_URL:
-    Pod2: "https://login2.responsys.net"
-    Pod5: "https://login5.responsys.net"
-"""
-LOGIN_BASE_URL = "https://login2.responsys.net"
-API_VERSION = "v1.3"
-BASE_RESOURCE_PATH = f"/rest/api/{API_VERSION}/"
-
-TRY_REQUEST_SETTINGS = {
-    # Number of attempts made for an API call before giving up
-    'times_to_try': 3,
-    # Amount of time in seconds to wait between each try
-    'wait_before_next_attempt': 30.0,
-    # Try an API call until one of the listed status codes is returned
-    'target_status_codes': [200],  # Add acceptable status codes to the list.
-    # Seconds to wait for an API call before timing out
-    'request_timeout': 20.0
-}
+# Responsys API
+"""Below URLs and API version were last checked to be up to date on 11/3/2019.
+LOGIN_BASE_URL:
+    Pod2: "https://login2.responsys.net"
+    Pod5: "https://login5.responsys.net"
+"""
+LOGIN_BASE_URL = "https://login2.responsys.net"
+API_VERSION = "v1.3"
+BASE_RESOURCE_PATH = f"/rest/api/{API_VERSION}/"
+# Page size used when fetching campaigns or programs; 200 is the documented
+# maximum, and a full page in fewer round trips is cheaper than more pages.
+DEFAULT_PAGE_LIMIT = 200
+
+# Seconds after a login or refresh when the auth token is proactively
+# refreshed on a background timer; Responsys tokens expire after two hours
+TOKEN_REFRESH_INTERVAL = 110 * 60.0
+
+# Seconds a fetched set of throttle limits stays cached; the limits
+# rarely change within a session, so repeat calls skip the round trip.
+THROTTLE_LIMITS_TTL = 15 * 60.0
+
+RATE_LIMIT_SETTINGS = {
+    # Requests per second allowed to leave the client; 0 disables pacing.
+    # Keep this within the account's throttle limits (get_throttle_limits).
+    'requests_per_second': 10.0,
+    # Extra burst capacity on top of one second's worth of tokens
+    'burst': 10.0
+}
+
+TRY_REQUEST_SETTINGS = {
+    # Number of attempts made for an API call before giving up
+    'times_to_try': 3,
+    # Base wait in seconds before the first retry; each later wait is
+    # drawn uniformly between this and three times the previous wait
+    # (decorrelated jitter), avoiding synchronized retry storms
+    'wait_before_next_attempt': 5.0,
+    # Upper bound in seconds on the jittered wait
+    'max_wait_before_next_attempt': 60.0,
+    # Try an API call until one of the listed status codes is returned
+    'target_status_codes': [200],  # Add acceptable status codes to the list.
+    # Seconds to wait for an API call before timing out
+    'request_timeout': 20.0
+}
+# Frozen once at import so the per-attempt membership test in the retry
+# loop is a hash lookup instead of a list scan.
+TRY_REQUEST_SETTINGS['target_status_codes'] = frozenset(
+    TRY_REQUEST_SETTINGS['target_status_codes']
+)
@@ -5,16 +5,75 @@ import secrets
 
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def main():
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y/%m/%d %H:%M:%S",
-        filename="demo.log"
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def dump_json(obj, file_name):
+    """Writes obj to file_name as indented JSON.
+
+    orjson serializes several times faster than the stdlib json module and
+    is used when installed; otherwise this falls back to json.dump.
+    """
+    if orjson is not None:
+        with open(file_name, 'wb') as output_file:
+            output_file.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_name, 'w') as output_file:
+            json.dump(obj=obj, indent=4, fp=output_file)
+
+
+def dump_msgpack(obj, file_name):
+    """Writes obj to file_name as MessagePack.
+
+    MessagePack is a compact binary format that serializes several times
+    faster and smaller than indented JSON, so it suits artifacts that are
+    only read back by other Python processes rather than by humans. Does
+    nothing when msgpack is not installed.
+    """
+    if msgpack is None:
+        return
+    with open(file_name, 'wb') as output_file:
+        msgpack.pack(obj, output_file, use_bin_type=True)
+
+
+def set_up_logging():
+    """Configures logging through a queue so file I/O stays off the hot path.
+
+    Records are handed to an in-memory queue and written to demo.log by a
+    QueueListener on a background thread, so the API calls never block on
+    the log file. Returns the listener; call its stop() before exiting to
+    flush any queued records.
+    """
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler("demo.log")
+    file_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y/%m/%d %H:%M:%S"
+        )
     )
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return listener
+
+
+def main():
+    listener = set_up_logging()
 
     logging.info("BEGIN: {script_name}".format(script_name=sys.argv[0]))
     # Start new session.
@@ -26,52 +85,36 @@ def main():
         secrets.USER_NAME, secrets.PASSWORD
     )
     # Output throttle limits into a json file.
-    with open("throttle_limits.json", 'w') as output_file:
-        json.dump(
-            obj=session.get_throttle_limits(),
-            indent=4,
-            fp=output_file
-        )
+    dump_json(session.get_throttle_limits(), "throttle_limits.json")
     # Output information on the next batch of campaigns into a json file.
-    with open("next_fetched_campaign_batch.json", 'w') as output_file:
-        json.dump(
-            obj=session.fetch_next_campaign_batch(),
-            indent=4,
-            fp=output_file
-        )
+    dump_json(
+        session.fetch_next_campaign_batch(), "next_fetched_campaign_batch.json"
+    )
     # Output information on a batch of campaigns into a json file.
-    with open("fetched_campaign_batch.json", 'w') as output_file:
-        json.dump(
-            obj=session.fetch_a_campaign_batch(
-                limit=200,
-                offset=0,
-                campaign_type="email"
-            ),
-            indent=4,
-            fp=output_file
-        )
+    dump_json(
+        session.fetch_a_campaign_batch(
+            limit=200,
+            offset=0,
+            campaign_type="email"
+        ),
+        "fetched_campaign_batch.json"
+    )
     # Output information on the next batch of campaigns into a json file.
-    with open("next_fetched_campaign_batch.json", 'w') as output_file:
-        json.dump(
-            obj=session.fetch_next_campaign_batch(),
-            indent=4,
-            fp=output_file
-        )
+    dump_json(
+        session.fetch_next_campaign_batch(), "next_fetched_campaign_batch.json"
+    )
     # Output information on all running programs into a json file.
-    with open("all_fetched_programs.json", 'w') as output_file:
-        json.dump(
-            obj=session.fetch_all_programs(status="RUNNING"),
-            indent=4,
-            fp=output_file
-        )
-    # Output information on all running campaigns into a json file.
-    with open("all_fetched_campaigns.json", 'w') as output_file:
-        json.dump(
-            obj=session.fetch_all_campaigns(campaign_type="email"),
-            indent=4,
-            fp=output_file
-        )
+    dump_json(
+        session.fetch_all_programs(status="RUNNING"),
+        "all_fetched_programs.json"
+    )
+    # Output information on all running campaigns into a json file, along
+    # with a compact binary copy for downstream Python consumers.
+    all_campaigns = session.fetch_all_campaigns(campaign_type="email")
+    dump_json(all_campaigns, "all_fetched_campaigns.json")
+    dump_msgpack(all_campaigns, "all_fetched_campaigns.msgpack")
     logging.info("END: {script_name}\n".format(script_name=sys.argv[0]))
+    listener.stop()
 
 
 if __name__ == '__main__':
@@ -1,575 +1,1223 @@
-import config
-import exceptions
-import utils
-
-import logging
-import requests
-import time
-from typing import Callable, Generator, Union
-
-
-class Session:
-    """Contains basic functionality to interact with Oracle Responsys API."""
-
-    def __init__(
-        self,
-        login_base_url: str = config.LOGIN_BASE_URL,
-        base_resource_path: str = config.BASE_RESOURCE_PATH
-    ) -> None:
-        """Initialized with the API login base URL and base resource path.
-
-        Parameters
-        ----------
-            login_base_url : str
-                The base URL used for authentication.
-            base_resource_path : str
-                The base resource path used for most of the API calls.
-        """
-        self._login_base_url: str = login_base_url
-        self._base_resource_path: str = base_resource_path
-        self._last_login_response: dict = {}
-        self._auth_token: str = ""
-        self._obtained_url: str = ""
-
-    # Getters
-    @property
-    def last_login_response(self):
-        """Stored authentication response."""
-        return self._last_login_response
-
-    def get_last_login_response(self):
-        """Stored authentication response."""
-        return self._last_login_response
-
-    @property
-    def auth_token(self):
-        """Token needed for most of the Responsys API requests."""
-        return self._auth_token
-
-    def get_auth_token(self):
-        """Token needed for most of the Responsys API requests."""
-        return self._auth_token
-
-    # Authentication
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Logging in with the username and password"
-    )
-    def password_login(
-        self,
-        user_name: str,
-        password: str
-    ) -> None:
-        """Retrieves and sets the auth token and endpoint for the session.
-
-        Member functions of the Session instance will automatically use the
-        generated auth token.
-
-        "The very first REST API request must be to authenticate to a specific
-        Responsys account. Upon successful authentication, a token and an
-        endpoint are returned in the response. You must use these authToken and
-        endPoint values for any subsequent REST API request."
-
-        Parameters
-        ----------
-            user_name : str
-            password : str
-        """
-        resource_path: str = self._base_resource_path + "auth/token"
-        response = self._try_request(
-                function=requests.post,
-                timeout=config.TRY_REQUEST_SETTINGS['request_timeout'],
-                url=self._login_base_url+resource_path,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                data={
-                    'user_name': user_name,
-                    'password': password,
-                    'auth_type': 'password'
-                }
-        )
-        self._set_last_login_response(response)
-        self._set_auth_token()
-        self._set_obtained_url()
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Refreshing auth token"
-    )
-    def refresh_token(self) -> None:
-        """Refreshes the auth token with the already existing token.
-
-        "In the REST API, the authorization token is stateless, and it always
-        expires after two hours. However, you can refresh the existing token
-        before it expires. If you refresh the token, the system generates a new
-        token from the existing valid one, so that you will not need to
-        re-authenticate. The same token used previously is not returned."
-        """
-        resource_path: str = self._base_resource_path + "auth/token"
-        response = self._try_request(
-            function=requests.post,
-            timeout=config.TRY_REQUEST_SETTINGS['request_timeout'],
-            url=self._login_base_url+resource_path,
-            headers={'Authorization': self._auth_token},
-            data={'auth_type': 'token'}
-        )
-        self._set_last_login_response(response)
-        self._set_auth_token()
-        self._set_obtained_url()
-
-    # API Throttle
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Retrieving Responsys API throttle limits"
-    )
-    def get_throttle_limits(self) -> dict:
-        """Obtains a list of API throttling limits for your Responsys account.
-
-        "Responsys monitors and throttles the frequency of API requests that
-        are submitted from each Oracle Responsys account. This is to ensure
-        that the best possible level of service is offered to API clients in a
-        shared environment."
-
-        Returns
-        -------
-            dict
-        """
-        resource_path: str = "/rest/api/ratelimit"
-        response = self._try_request(
-            function=requests.get,
-            timeout=config.TRY_REQUEST_SETTINGS['request_timeout'],
-            url=self._obtained_url+resource_path,
-            headers={'Authorization': self._auth_token}
-        )
-        return response.json()
-
-    # Campaigns
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Fetching a campaign"
-    )
-    def fetch_a_campaign(self, campaign_name: str) -> dict:
-        """Fetches the campaign object and its properties.
-
-        "Campaign object includes the campaign ID and the campaign's other
-        properties. The links array contains the campaign object's related API
-        operations, specific to the campaign name where applicable."
-
-        Parameters
-        ----------
-            campaign_name : str
-
-        Returns
-        -------
-            dict
-        """
-        resource_path: str = self._base_resource_path + "campaigns/" +  \
-            campaign_name
-        response = self._try_request(
-            function=requests.get,
-            timeout=config.TRY_REQUEST_SETTINGS['request_timeout'],
-            url=self._obtained_url+resource_path,
-            headers={
-                'Authorization': self._auth_token,
-                'Content-Type': 'application/json'
-            }
-        )
-        return response.json()
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Fetching a campaign batch"
-    )
-    def fetch_a_campaign_batch(
-        self,
-        limit: int = 200, offset: int = 0, campaign_type: str = "email"
-    ) -> dict:
-        """Fetches a maximum of 200 campaigns and their properties at a time.
-
-        "Obtain the campaign properties for all EMD Email, Push, Message
-        Center, SMS, or MMS campaigns."
-
-        Retrieved in ascending order of campaign id.
-        Resets the current page/position of the campaign batch generator.
-        Use fetch_next_campaign_batch to get the next batch.
-
-        Parameters
-        ----------
-            offset : int
-            limit : int
-            campaign_type : str
-
-        Returns
-        -------
-            dict
-        """
-        self._batch_of_campaigns: Generator = self._campaign_batch_generator(
-            limit=limit, offset=offset, campaign_type=campaign_type
-        )
-        fetch: dict = next(self._batch_of_campaigns)
-        return fetch
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Fetching next campaign batch"
-    )
-    def fetch_next_campaign_batch(self) -> Union[dict, None]:
-        """Get the next batch of the fetch_a_campaign_batch.
-
-        Cannot be used successfully if the function, fetch_a_campaign_batch,
-        has not been used yet.
-        Retrieved in ascending order of campaign id.
-        """
-        try:
-            fetch: dict = next(self._batch_of_campaigns)
-            return fetch
-        except AttributeError:
-            logging.exception(
-                "fetch_a_campaign_batch must be called before "
-                "fetch_next_campaign_batch can be called."
-            )
-        except StopIteration:
-            logging.exception("The last campaign has already been fetched.")
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Begin fetching every campaign",
-        after_msg="Finished fetching every campaign"
-    )
-    def fetch_all_campaigns(
-        self, campaign_type: str = "email"
-    ) -> dict:
-        """Fetches every campaign.
-
-        Parameters
-        ----------
-            campaign_type : str
-
-        Returns
-        -------
-            dict
-        """
-        batch: Generator = self._campaign_batch_generator(
-            limit=200, offset=0, campaign_type=campaign_type
-        )
-        fetched: dict = next(batch)
-        while True:
-            try:
-                next_batch: dict = next(batch)
-                fetched['campaigns'] += next_batch['campaigns']
-                fetched['links'] += next_batch['links']
-            except StopIteration:
-                break
-        self._dedupe("campaigns", fetched)
-        return fetched
-
-    # Programs
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Fetching a program batch"
-    )
-    def fetch_a_program_batch(
-        self,
-        limit: int = 200, offset: int = 0, status: str = ""
-    ) -> dict:
-        """Fetches a maximum of 200 programs and their properties at a time.
-
-        "Use this interface to get a list of Responsys program orchestrations
-        for an account and the associated metadata for each program. The
-        response includes draft and published programs, and it includes program
-        status information."
-
-        Retrieved in ascending order of program id.
-        Resets the current page/position of the program batch generator.
-        Use fetch_next_program_batch to get the next batch.
-
-        Parameters
-        ----------
-            limit : int
-            offset : int
-            status : str
-
-        Returns
-        -------
-            dict
-        """
-        self._batch_of_programs: Generator = self._program_batch_generator(
-            limit=limit, offset=offset, status=status
-        )
-        fetch: dict = next(self._batch_of_programs)
-        return fetch
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Fetching next program batch"
-    )
-    def fetch_next_program_batch(self) -> Union[dict, None]:
-        """Get the next batch after the fetch_a_program_batch.
-
-        Cannot be used successfully if the function, fetch_a_program_batch, has
-        not been used yet.
-        Retrieved in ascending order of program id.
-        """
-        try:
-            fetch: dict = next(self._batch_of_programs)
-            return fetch
-        except AttributeError:
-            logging.exception(
-                "fetch_a_program_batch must be called before "
-                "fetch_next_program_batch can be called."
-            )
-        except StopIteration:
-            logging.exception("The last program has already been fetched.")
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Begin fetching every program",
-        after_msg="Finished fetching every program"
-    )
-    def fetch_all_programs(self, status: str = "") -> dict:
-        """Fetches every program.
-
-        Parameters
-        ----------
-            status : str
-
-        Returns
-        -------
-            dict
-        """
-        batch: Generator = self._program_batch_generator(
-            limit=200, offset=0, status=status
-        )
-        fetched: dict = next(batch)
-        while True:
-            try:
-                next_batch: dict = next(batch)
-                fetched['programs'] += next_batch['programs']
-                fetched['links'] += next_batch['links']
-            except StopIteration:
-                break
-        self._dedupe("programs", fetched)
-        return fetched
-
-    # Private member functions
-    @utils.log_wrap(
-        logging_func=logging.debug,
-        before_msg="Setting the last login response"
-    )
-    def _set_last_login_response(self, response: requests.Response) -> None:
-        """Sets and saves the last login response.
-
-        Parameters
-        ----------
-            response : requests.Response
-        """
-        self._last_login_response = response.json()
-
-    @utils.log_wrap(
-        logging_func=logging.debug,
-        before_msg="Setting the auth token"
-    )
-    def _set_auth_token(self) -> None:
-        """Sets the auth token needed for most of the other API calls."""
-        self._auth_token = self._last_login_response['authToken']
-
-    @utils.log_wrap(
-        logging_func=logging.debug,
-        before_msg="Setting the obtained URL"
-    )
-    def _set_obtained_url(self) -> None:
-        """Sets the obtained URL needed for most of the other API calls."""
-        self._obtained_url = self._last_login_response['endPoint']
-
-    @utils.log_wrap(
-        logging_func=logging.debug,
-        before_msg="Trying request"
-    )
-    def _try_request(
-        self,
-        function: Callable,
-        settings: dict = config.TRY_REQUEST_SETTINGS,
-        *args,
-        **kwargs
-    ) -> requests.Response:
-        """Attempts the passed function a specified number of times.
-
-        Non-zero exit status returned after the last attempt.
-
-        Parameters
-        ----------
-            settings : dict
-                times_to_try : int
-                    Number of attempts made for an API call before giving up.
-                wait_before_next_attempt : float
-                    Amount of time in seconds to wait between each attempt.
-                target_status_codes : list
-                    Try an API call until this status code is returned.
-            function : func
-                Pointer to the request function.
-            *args
-                Variable length argument list for the passed function.
-            **kwargs
-                Keyword arguments for the passed function.
-        Returns:
-        --------
-            response (requests.Response)
-        """
-        for i in range(settings['times_to_try']):
-            try:
-                response = function(
-                    *args, **kwargs
-                )
-                if response.status_code not in settings['target_status_codes']:
-                    logging.warning(
-                        "Targeted status code was not returned. "
-                        f"Response status code == {response.status_code}. "
-                        f"Attempts so far: {i+1}"
-                    )
-                else:
-                    return response
-            except requests.exceptions.HTTPError:
-                logging.warning(
-                    f"Unsuccessful status code {response.status_code} was"
-                    f"returned. Attempts so far: {i+1}"
-                )
-            except requests.exceptions.Timeout:
-                logging.warning(
-                    f"Request timed out. Attempts so far: {i+1}"
-                )
-            except requests.exceptions.ConnectionError:
-                logging.warning(
-                    f"Connection error encountered. Attempts so far: {i+1}"
-                )
-            except requests.exceptions.TooManyRedirects:
-                logging.warning(
-                    f"Request exceeded the configured number of maximum "
-                    f"redirections. Attempts so far: {i+1}"
-                )
-            if i+1 != config.TRY_REQUEST_SETTINGS['times_to_try']:
-                logging.warning(
-                    "Retrying in {} seconds...".format(
-                        config.TRY_REQUEST_SETTINGS['wait_before_next_attempt']
-                    )
-                )
-                time.sleep(
-                    config.TRY_REQUEST_SETTINGS['wait_before_next_attempt']
-                )
-        logging.critical(
-            f"Failed request {settings['times_to_try']} times, exiting "
-            "program."
-        )
-        raise exceptions.FailedTryRequest()
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Generating batch of campaigns"
-    )
-    def _campaign_batch_generator(
-        self,
-        limit: int = 200, offset: int = 0, campaign_type: str = "email"
-    ) -> Generator:
-        """Retrieves the next batch of programs with each iteration.
-
-        Parameters
-        ----------
-            offset : int
-            limit : int
-            campaign_type : str
-
-        Yields
-        -------
-            dict
-        """
-        resource_path: str = self._base_resource_path +  \
-            f"campaigns?limit={limit}&offset={offset}&type={campaign_type}"
-        while resource_path != "":
-            response = self._try_request(
-                function=requests.get,
-                timeout=config.TRY_REQUEST_SETTINGS['request_timeout'],
-                url=self._obtained_url+resource_path,
-                headers={
-                    'Authorization': self._auth_token,
-                    'Content-Type': 'application/json'
-                }
-            )
-            response_json = response.json()
-            yield response_json
-            resource_path = self._get_next_resource_path(response_json)
-
-    @utils.log_wrap(
-        logging_func=logging.info,
-        before_msg="Generating a batch of programs"
-    )
-    def _program_batch_generator(
-        self,
-        limit: int = 200, offset: int = 0, status: str = ""
-    ) -> Generator:
-        """Retrieves the next batch of programs with each iteration.
-
-        Parameters
-        ----------
-            limit : int
-            offset : int
-            status : str
-
-        Yields
-        -------
-            dict
-        """
-        resource_path: str = self._base_resource_path +  \
-            f"programs?limit={limit}&offset={offset}&status={status}"
-        while resource_path:
-            response = self._try_request(
-                function=requests.get,
-                timeout=config.TRY_REQUEST_SETTINGS['request_timeout'],
-                url=self._obtained_url+resource_path,
-                headers={
-                    'Authorization': self._auth_token,
-                    'Content-Type': 'application/json'
-                }
-            )
-            response_json = response.json()
-            yield response_json
-            resource_path = self._get_next_resource_path(response_json)
-
-    @utils.log_wrap(
-        logging_func=logging.debug,
-        before_msg="Getting the resource path for the next batch, if available"
-    )
-    def _get_next_resource_path(self, fetched: dict) -> str:
-        """Retrieves next href value from results of a complete fetch all.
-
-        Parameters
-        ----------
-            fetched : dict
-
-        Returns
-        -------
-            str
-        """
-        resource_path: str = ""
-        for link in fetched['links']:
-            if 'rel' in link and 'next' == link['rel']:
-                resource_path = link['href']
-                break
-        return resource_path
-
-    @utils.log_wrap(
-        logging_func=logging.debug,
-        before_msg="Deduping"
-    )
-    def _dedupe(self, object_type: str, fetched: dict) -> None:
-        """Drops any duplicate fetched campaigns or programs.
-
-        Parameters
-        ----------
-            object_type : str
-                The options are "campaigns" or "programs".
-            fetched : dict
-        """
-        fetched[object_type] = list(
-            {
-                object['id']: object
-                for object in fetched[object_type]
-            }.values()
-        )
+import config
+import exceptions
+import utils
+
+import concurrent.futures
+import functools
+import logging
+import random
+import requests
+import socket
+import threading
+import time
+import urllib3
+from typing import Callable, Generator, Union
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class _KeepAliveHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that turns on TCP keep-alive probes for pooled sockets.
+
+    Responsys auth tokens live for two hours and calls within a session can
+    be widely spaced. Without keep-alive probes, NAT boxes and firewalls
+    silently drop idle pool sockets, and the next call pays a fresh TCP+TLS
+    handshake. The probe timing options are platform-specific and are only
+    applied where the socket module exposes them.
+    """
+
+    _socket_options: list = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        _socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        _socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30))
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] =  \
+            urllib3.connection.HTTPConnection.default_socket_options  \
+            + self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class Session:
+    """Contains basic functionality to interact with Oracle Responsys API."""
+
+    def __init__(
+        self,
+        login_base_url: str = config.LOGIN_BASE_URL,
+        base_resource_path: str = config.BASE_RESOURCE_PATH
+    ) -> None:
+        """Initialized with the API login base URL and base resource path.
+
+        Parameters
+        ----------
+            login_base_url : str
+                The base URL used for authentication.
+            base_resource_path : str
+                The base resource path used for most of the API calls.
+        """
+        self._login_base_url: str = login_base_url
+        self._base_resource_path: str = base_resource_path
+        self._last_login_response: dict = {}
+        self._auth_token: str = ""
+        self._obtained_url: str = ""
+        self._endpoint_urls: dict = {}
+        # The auth endpoint depends only on constructor arguments, so it
+        # is assembled once here rather than on every login or refresh.
+        self._auth_url: str =  \
+            login_base_url + base_resource_path + "auth/token"
+        # Cached once at construction; the request call sites otherwise
+        # re-read the config dict on every call.
+        self._request_timeout: float =  \
+            config.TRY_REQUEST_SETTINGS['request_timeout']
+        # Pacing every outgoing request through a shared token bucket
+        # keeps bursts from the concurrent fetch paths inside the
+        # account's throttle limits instead of retrying into a 429 wall.
+        rate: float = config.RATE_LIMIT_SETTINGS['requests_per_second']
+        self._rate_limiter: Union[utils.TokenBucket, None] =  \
+            utils.TokenBucket(
+                rate=rate,
+                capacity=rate + config.RATE_LIMIT_SETTINGS['burst']
+            ) if rate > 0 else None
+        # Guards token mutation, which can happen on the background
+        # refresh timer thread while worker threads are mid-request.
+        self._token_lock: threading.Lock = threading.Lock()
+        self._refresh_timer: Union[threading.Timer, None] = None
+        self._throttle_limits_future:  \
+            Union[concurrent.futures.Future, None] = None
+        # (expiry, limits) pair; see get_throttle_limits.
+        self._throttle_limits_cache: Union[tuple, None] = None
+        # One pooled HTTP session reuses keep-alive connections to the
+        # Responsys host instead of paying a TCP+TLS handshake per call.
+        # Transient socket-level failures (DNS hiccups, connection resets)
+        # are retried by urllib3 inside the adapter; status-code policy,
+        # backoff with Retry-After, and FailedTryRequest stay with
+        # _try_request, which would otherwise burn a whole attempt on a
+        # dropped connection.
+        self._http: requests.Session = requests.Session()
+        adapter = _KeepAliveHTTPAdapter(
+            pool_connections=4, pool_maxsize=32,
+            max_retries=urllib3.util.Retry(
+                total=3, connect=3, read=2, status=0,
+                backoff_factor=0.5,
+                allowed_methods=frozenset(['GET', 'POST']),
+                # Without this, urllib3 treats any 429/503 carrying a
+                # Retry-After header as retryable despite status=0 and
+                # raises MaxRetryError instead of returning the response;
+                # _try_request owns the Retry-After and penalize policy.
+                respect_retry_after_header=False
+            )
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        # Most calls send JSON; password_login and refresh_token override
+        # this per call with their form-encoded content type. The
+        # Authorization header joins the session headers once the auth
+        # token is obtained, so the per-call headers= dicts are no longer
+        # rebuilt for every request.
+        self._http.headers['Content-Type'] = "application/json"
+        # The large paginated JSON responses compress roughly 5-10x.
+        # urllib3 decompresses transparently; br is only negotiated when the
+        # brotli package is installed.
+        self._http.headers['Accept-Encoding'] = "gzip, deflate, br"
+
+    def close(self) -> None:
+        """Closes the pooled HTTP session and its keep-alive connections.
+
+        Also cancels the background token refresh timer, if one is set.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._http.close()
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # Getters
+    @property
+    def last_login_response(self):
+        """Stored authentication response."""
+        return self._last_login_response
+
+    @property
+    def auth_token(self):
+        """Token needed for most of the Responsys API requests."""
+        return self._auth_token
+
+    # Authentication
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Logging in with the username and password"
+    )
+    def password_login(
+        self,
+        user_name: str,
+        password: str,
+        prefetch_throttle_limits: bool = False
+    ) -> None:
+        """Retrieves and sets the auth token and endpoint for the session.
+
+        Member functions of the Session instance will automatically use the
+        generated auth token.
+
+        "The very first REST API request must be to authenticate to a specific
+        Responsys account. Upon successful authentication, a token and an
+        endpoint are returned in the response. You must use these authToken and
+        endPoint values for any subsequent REST API request."
+
+        Parameters
+        ----------
+            user_name : str
+            password : str
+            prefetch_throttle_limits : bool
+                Kick off the usual login-then-probe follow-up in the
+                background, so the first get_throttle_limits call returns
+                without paying its own round trip.
+        """
+        response = self._try_request(
+                function=self._http.post,
+                timeout=self._request_timeout,
+                url=self._auth_url,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                data={
+                    'user_name': user_name,
+                    'password': password,
+                    'auth_type': 'password'
+                }
+        )
+        self._apply_login_response(response)
+        self._schedule_token_refresh()
+        if prefetch_throttle_limits:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._throttle_limits_future = executor.submit(
+                self._fetch_throttle_limits
+            )
+            executor.shutdown(wait=False)
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Refreshing auth token"
+    )
+    def refresh_token(self) -> None:
+        """Refreshes the auth token with the already existing token.
+
+        "In the REST API, the authorization token is stateless, and it always
+        expires after two hours. However, you can refresh the existing token
+        before it expires. If you refresh the token, the system generates a new
+        token from the existing valid one, so that you will not need to
+        re-authenticate. The same token used previously is not returned."
+        """
+        response = self._try_request(
+            function=self._http.post,
+            timeout=self._request_timeout,
+            url=self._auth_url,
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            data={'auth_type': 'token'}
+        )
+        self._apply_login_response(response)
+        self._schedule_token_refresh()
+
+    # API Throttle
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Retrieving Responsys API throttle limits"
+    )
+    def get_throttle_limits(self) -> dict:
+        """Obtains a list of API throttling limits for your Responsys account.
+
+        "Responsys monitors and throttles the frequency of API requests that
+        are submitted from each Oracle Responsys account. This is to ensure
+        that the best possible level of service is offered to API clients in a
+        shared environment."
+
+        The fetched limits are cached for config.THROTTLE_LIMITS_TTL
+        seconds, since they rarely change within a session, and each fresh
+        fetch re-seeds the client-side token bucket from the account's
+        declared per-minute budget.
+
+        Returns
+        -------
+            dict
+        """
+        cached = self._throttle_limits_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        if self._throttle_limits_future is not None:
+            future = self._throttle_limits_future
+            self._throttle_limits_future = None
+            limits = future.result()
+        else:
+            limits = self._fetch_throttle_limits()
+        self._throttle_limits_cache = (
+            time.monotonic() + config.THROTTLE_LIMITS_TTL, limits
+        )
+        self._seed_rate_limiter(limits)
+        return limits
+
+    def _seed_rate_limiter(self, limits: dict) -> None:
+        """Resizes the token bucket from the account's declared limits.
+
+        When a per-minute request limit is recognizable in the response,
+        the smallest one replaces the configured pacing rate so the client
+        tracks the account's actual budget instead of a guess. Responses
+        in an unrecognized shape leave the configured rate untouched.
+
+        Parameters
+        ----------
+            limits : dict
+                Parsed response from the ratelimit endpoint.
+        """
+        if self._rate_limiter is None:
+            return
+        per_minute = [
+            record['maxRequests']
+            for record in limits.get('limits', ())
+            if record.get('timeRange') == 'perMinute'
+            and isinstance(record.get('maxRequests'), (int, float))
+            # A zero limit would set a rate the bucket divides by on
+            # every acquire, and 0 means "pacing disabled" elsewhere.
+            and record['maxRequests'] > 0
+        ]
+        if not per_minute:
+            return
+        rate: float = min(per_minute) / 60.0
+        self._rate_limiter.rate = rate
+        self._rate_limiter.capacity =  \
+            rate + config.RATE_LIMIT_SETTINGS['burst']
+
+    def _fetch_throttle_limits(self) -> dict:
+        """Requests the throttle limits from the API."""
+        response = self._try_request(
+            function=self._http.get,
+            timeout=self._request_timeout,
+            url=self._endpoint_urls['ratelimit']
+        )
+        return self._read_json(response)
+
+    # Campaigns
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Fetching a campaign"
+    )
+    def fetch_a_campaign(self, campaign_name: str) -> dict:
+        """Fetches the campaign object and its properties.
+
+        "Campaign object includes the campaign ID and the campaign's other
+        properties. The links array contains the campaign object's related API
+        operations, specific to the campaign name where applicable."
+
+        Parameters
+        ----------
+            campaign_name : str
+
+        Returns
+        -------
+            dict
+        """
+        response = self._try_request(
+            function=self._http.get,
+            timeout=self._request_timeout,
+            url=self._endpoint_urls['campaigns'] + "/" + campaign_name
+        )
+        return self._read_json(response)
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Begin fetching several campaigns",
+        after_msg="Finished fetching several campaigns"
+    )
+    def fetch_campaigns(
+        self, campaign_names: list, max_workers: int = 10
+    ) -> dict:
+        """Fetches several named campaigns at the same time.
+
+        The fetch_a_campaign calls run on a small pool of worker threads
+        over the pooled HTTP session, overlapping their round trips instead
+        of paying one per campaign. Keep max_workers modest to stay within
+        the account's API throttle limits.
+
+        Parameters
+        ----------
+            campaign_names : list
+            max_workers : int
+                Number of campaigns requested at the same time.
+
+        Returns
+        -------
+            dict
+                Maps each campaign name to its fetched campaign object.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(campaign_names)) or 1
+        ) as executor:
+            return dict(
+                zip(
+                    campaign_names,
+                    executor.map(self.fetch_a_campaign, campaign_names)
+                )
+            )
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Fetching a campaign batch"
+    )
+    def fetch_a_campaign_batch(
+        self,
+        limit: int = config.DEFAULT_PAGE_LIMIT, offset: int = 0,
+        campaign_type: str = "email"
+    ) -> dict:
+        """Fetches a maximum of 200 campaigns and their properties at a time.
+
+        "Obtain the campaign properties for all EMD Email, Push, Message
+        Center, SMS, or MMS campaigns."
+
+        Retrieved in ascending order of campaign id.
+        Resets the current page/position of the campaign batch generator.
+        Use fetch_next_campaign_batch to get the next batch.
+
+        Parameters
+        ----------
+            offset : int
+            limit : int
+            campaign_type : str
+
+        Returns
+        -------
+            dict
+        """
+        self._batch_of_campaigns: Generator = self._campaign_batch_generator(
+            limit=limit, offset=offset, campaign_type=campaign_type
+        )
+        fetch: dict = next(self._batch_of_campaigns)
+        return fetch
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Fetching next campaign batch"
+    )
+    def fetch_next_campaign_batch(self) -> Union[dict, None]:
+        """Get the next batch of the fetch_a_campaign_batch.
+
+        Cannot be used successfully if the function, fetch_a_campaign_batch,
+        has not been used yet.
+        Retrieved in ascending order of campaign id.
+        """
+        try:
+            fetch: dict = next(self._batch_of_campaigns)
+            return fetch
+        except AttributeError:
+            logger.exception(
+                "fetch_a_campaign_batch must be called before "
+                "fetch_next_campaign_batch can be called."
+            )
+        except StopIteration:
+            logger.exception("The last campaign has already been fetched.")
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Begin fetching every campaign",
+        after_msg="Finished fetching every campaign"
+    )
+    def fetch_all_campaigns(
+        self, campaign_type: str = "email", max_workers: int = 1,
+        projection: Union[list, None] = None
+    ) -> dict:
+        """Fetches every campaign.
+
+        With max_workers above 1, the pages after the first one are requested
+        concurrently instead of one round trip at a time. Keep max_workers
+        modest to stay within the account's API throttle limits.
+
+        Parameters
+        ----------
+            campaign_type : str
+            max_workers : int
+                Number of pages requested at the same time.
+            projection : list or None
+                Keys to keep on each returned campaign. Trimming is done
+                page by page, so the full records never accumulate in
+                memory; 'id' is always retained since the cross-page
+                dedupe keys on it. None keeps the records whole.
+
+        Returns
+        -------
+            dict
+        """
+        if max_workers > 1:
+            return self._fetch_all_concurrently(
+                object_type="campaigns",
+                extra_params={'type': campaign_type},
+                max_workers=max_workers,
+                projection=projection
+            )
+        batch: Generator = self._campaign_batch_generator(
+            limit=config.DEFAULT_PAGE_LIMIT, offset=0,
+            campaign_type=campaign_type
+        )
+        fetched = next(batch)
+        if projection is not None:
+            self._project_records("campaigns", fetched, projection)
+        # Keying the accumulator by id dedupes on the fly, so no separate
+        # pass over the merged list is needed afterwards.
+        campaigns_by_id: dict = {
+            campaign['id']: campaign for campaign in fetched['campaigns']
+        }
+        while True:
+            try:
+                next_batch: dict = next(batch)
+                if projection is not None:
+                    self._project_records(
+                        "campaigns", next_batch, projection
+                    )
+                campaigns_by_id.update(
+                    (campaign['id'], campaign)
+                    for campaign in next_batch['campaigns']
+                )
+                fetched['links'] += next_batch['links']
+            except StopIteration:
+                break
+        fetched['campaigns'] = list(campaigns_by_id.values())
+        return fetched
+
+    def iter_all_campaigns(self, campaign_type: str = "email") -> Generator:
+        """Yields every campaign one record at a time.
+
+        Streams records page by page, so consumers can write each one out
+        as it arrives instead of materializing the merged
+        fetch_all_campaigns dict. Duplicate campaign ids across page
+        boundaries are skipped as they stream in.
+
+        Parameters
+        ----------
+            campaign_type : str
+
+        Yields
+        -------
+            dict
+        """
+        # log_wrap would fire both messages when the generator object is
+        # created, before anything is fetched, so the messages live in the
+        # generator body instead.
+        logger.info("Begin iterating over every campaign")
+        seen_ids: set = set()
+        for batch in self._campaign_batch_generator(
+            limit=config.DEFAULT_PAGE_LIMIT, offset=0,
+            campaign_type=campaign_type
+        ):
+            for campaign in batch['campaigns']:
+                if campaign['id'] not in seen_ids:
+                    seen_ids.add(campaign['id'])
+                    yield campaign
+        logger.info("Finished iterating over every campaign")
+
+    # Programs
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Fetching a program batch"
+    )
+    def fetch_a_program_batch(
+        self,
+        limit: int = config.DEFAULT_PAGE_LIMIT, offset: int = 0,
+        status: str = ""
+    ) -> dict:
+        """Fetches a maximum of 200 programs and their properties at a time.
+
+        "Use this interface to get a list of Responsys program orchestrations
+        for an account and the associated metadata for each program. The
+        response includes draft and published programs, and it includes program
+        status information."
+
+        Retrieved in ascending order of program id.
+        Resets the current page/position of the program batch generator.
+        Use fetch_next_program_batch to get the next batch.
+
+        Parameters
+        ----------
+            limit : int
+            offset : int
+            status : str
+
+        Returns
+        -------
+            dict
+        """
+        self._batch_of_programs: Generator = self._program_batch_generator(
+            limit=limit, offset=offset, status=status
+        )
+        fetch: dict = next(self._batch_of_programs)
+        return fetch
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Fetching next program batch"
+    )
+    def fetch_next_program_batch(self) -> Union[dict, None]:
+        """Get the next batch after the fetch_a_program_batch.
+
+        Cannot be used successfully if the function, fetch_a_program_batch, has
+        not been used yet.
+        Retrieved in ascending order of program id.
+        """
+        try:
+            fetch: dict = next(self._batch_of_programs)
+            return fetch
+        except AttributeError:
+            logger.exception(
+                "fetch_a_program_batch must be called before "
+                "fetch_next_program_batch can be called."
+            )
+        except StopIteration:
+            logger.exception("The last program has already been fetched.")
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Begin fetching every program",
+        after_msg="Finished fetching every program"
+    )
+    def fetch_all_programs(
+        self, status: str = "", max_workers: int = 1,
+        projection: Union[list, None] = None
+    ) -> dict:
+        """Fetches every program.
+
+        With max_workers above 1, the pages after the first one are requested
+        concurrently instead of one round trip at a time. Keep max_workers
+        modest to stay within the account's API throttle limits.
+
+        Parameters
+        ----------
+            status : str
+            max_workers : int
+                Number of pages requested at the same time.
+            projection : list or None
+                Keys to keep on each returned program. Trimming is done
+                page by page, so the full records never accumulate in
+                memory; 'id' is always retained since the cross-page
+                dedupe keys on it. None keeps the records whole.
+
+        Returns
+        -------
+            dict
+        """
+        if max_workers > 1:
+            return self._fetch_all_concurrently(
+                object_type="programs",
+                extra_params={'status': status},
+                max_workers=max_workers,
+                projection=projection
+            )
+        batch: Generator = self._program_batch_generator(
+            limit=config.DEFAULT_PAGE_LIMIT, offset=0, status=status
+        )
+        fetched = next(batch)
+        if projection is not None:
+            self._project_records("programs", fetched, projection)
+        # Keying the accumulator by id dedupes on the fly, so no separate
+        # pass over the merged list is needed afterwards.
+        programs_by_id: dict = {
+            program['id']: program for program in fetched['programs']
+        }
+        while True:
+            try:
+                next_batch: dict = next(batch)
+                if projection is not None:
+                    self._project_records(
+                        "programs", next_batch, projection
+                    )
+                programs_by_id.update(
+                    (program['id'], program)
+                    for program in next_batch['programs']
+                )
+                fetched['links'] += next_batch['links']
+            except StopIteration:
+                break
+        fetched['programs'] = list(programs_by_id.values())
+        return fetched
+
+    def iter_all_programs(self, status: str = "") -> Generator:
+        """Yields every program one record at a time.
+
+        Streams records page by page, so consumers can write each one out
+        as it arrives instead of materializing the merged
+        fetch_all_programs dict. Duplicate program ids across page
+        boundaries are skipped as they stream in.
+
+        Parameters
+        ----------
+            status : str
+
+        Yields
+        -------
+            dict
+        """
+        # log_wrap would fire both messages when the generator object is
+        # created, before anything is fetched, so the messages live in the
+        # generator body instead.
+        logger.info("Begin iterating over every program")
+        seen_ids: set = set()
+        for batch in self._program_batch_generator(
+            limit=config.DEFAULT_PAGE_LIMIT, offset=0, status=status
+        ):
+            for program in batch['programs']:
+                if program['id'] not in seen_ids:
+                    seen_ids.add(program['id'])
+                    yield program
+        logger.info("Finished iterating over every program")
+
+    # Private member functions
+    def _apply_login_response(self, response: requests.Response) -> None:
+        """Stores the login response and everything derived from it.
+
+        The response body is parsed once and the login state — the auth
+        token, the obtained URL and the precomputed endpoint URLs — is
+        written in one place. The token is also stamped onto the pooled
+        session's headers, so every subsequent request carries it without
+        rebuilding a headers dict per call.
+
+        Parameters
+        ----------
+            response : requests.Response
+        """
+        fetched = self._read_json(response)
+        obtained_url = fetched['endPoint']
+        with self._token_lock:
+            self._last_login_response = fetched
+            self._auth_token = fetched['authToken']
+            self._http.headers['Authorization'] = self._auth_token
+            self._obtained_url = obtained_url
+            self._endpoint_urls = {
+                'campaigns':
+                    obtained_url + self._base_resource_path + "campaigns",
+                'programs':
+                    obtained_url + self._base_resource_path + "programs",
+                'ratelimit': obtained_url + "/rest/api/ratelimit"
+            }
+
+    def _schedule_token_refresh(self) -> None:
+        """Schedules a background refresh before the two-hour token expiry.
+
+        A long-running fetch that straddles the expiry would otherwise fail
+        mid-pagination and have to restart from scratch. The timer thread
+        is a daemon so it never keeps the interpreter alive on exit.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._refresh_timer = threading.Timer(
+            config.TOKEN_REFRESH_INTERVAL, self._background_refresh
+        )
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self) -> None:
+        """Refreshes the auth token from the background timer thread.
+
+        Failures are logged instead of raised, since nothing on the timer
+        thread could catch them; a genuinely expired token then surfaces on
+        the next API call. refresh_token reschedules the timer on success.
+        """
+        try:
+            self.refresh_token()
+        except exceptions.FailedTryRequest:
+            logger.exception("Background token refresh failed.")
+
+    def _read_json(self, response: requests.Response) -> dict:
+        """Parses the JSON body of a response.
+
+        When ijson is installed and the response was requested with
+        stream=True, the body is parsed incrementally off the socket instead
+        of being buffered in full as text first, which lowers peak memory on
+        the large paginated responses. Buffered responses are decoded with
+        orjson when it is installed, several times faster than the stdlib
+        parser on the larger payloads.
+
+        Parameters
+        ----------
+            response : requests.Response
+
+        Returns
+        -------
+            dict
+        """
+        if ijson is not None and not response.raw.closed:
+            # Let urllib3 decompress the stream before ijson reads it.
+            response.raw.decode_content = True
+            return next(ijson.items(response.raw, ''), {})
+        if orjson is not None:
+            # orjson parses straight from bytes, skipping the utf-8 decode
+            # and the slower stdlib tokenizer behind response.json().
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _try_request(
+        self,
+        function: Callable,
+        settings: dict = config.TRY_REQUEST_SETTINGS,
+        *args,
+        **kwargs
+    ) -> requests.Response:
+        """Attempts the passed function a specified number of times.
+
+        Non-zero exit status returned after the last attempt.
+
+        Parameters
+        ----------
+            settings : dict
+                times_to_try : int
+                    Number of attempts made for an API call before giving up.
+                wait_before_next_attempt : float
+                    Base wait in seconds before the first retry; later
+                    waits are jittered upward from it.
+                max_wait_before_next_attempt : float
+                    Upper bound in seconds on the jittered wait.
+                target_status_codes : frozenset
+                    Try an API call until one of these status codes is
+                    returned.
+            function : func
+                Pointer to the request function.
+            *args
+                Variable length argument list for the passed function.
+            **kwargs
+                Keyword arguments for the passed function.
+        Returns:
+        --------
+            response (requests.Response)
+        """
+        logger.debug("Trying request")
+        # Bind the settings to locals once; the loop below otherwise pays a
+        # dict lookup per attempt. target_status_codes is already a
+        # frozenset (frozen at import in config), so membership is a hash
+        # lookup.
+        times_to_try: int = settings['times_to_try']
+        target_status_codes: frozenset = settings['target_status_codes']
+        wait_time: float = settings['wait_before_next_attempt']
+        # Bind the arguments once so each retry is a bare call instead of
+        # re-expanding *args/**kwargs on every attempt.
+        request_function = functools.partial(function, *args, **kwargs)
+        for i in range(times_to_try):
+            response = None
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                response = request_function()
+                status = response.status_code
+                # Fast-path the overwhelmingly common 200 before the set
+                # membership test.
+                if status == 200 or status in target_status_codes:
+                    return response
+                if status == 429 and self._rate_limiter is not None:
+                    self._rate_limiter.penalize()
+                logger.warning(
+                    "Targeted status code was not returned. "
+                    "Response status code == %s. Attempts so far: %s",
+                    status, i+1
+                )
+            except requests.exceptions.Timeout:
+                logger.warning(
+                    "Request timed out. Attempts so far: %s", i+1
+                )
+            except requests.exceptions.ConnectionError:
+                logger.warning(
+                    "Connection error encountered. Attempts so far: %s", i+1
+                )
+            except requests.exceptions.TooManyRedirects:
+                logger.warning(
+                    "Request exceeded the configured number of maximum "
+                    "redirections. Attempts so far: %s", i+1
+                )
+            except requests.exceptions.RequestException as exc:
+                logger.warning(
+                    "Request failed: %s. Attempts so far: %s", exc, i+1
+                )
+            if i+1 != times_to_try:
+                wait_time = self._backoff_wait_time(
+                    previous_wait=wait_time, response=response,
+                    settings=settings
+                )
+                logger.warning("Retrying in %.1f seconds...", wait_time)
+                time.sleep(wait_time)
+        logger.critical(
+            "Failed request %s times, exiting program.", times_to_try
+        )
+        raise exceptions.FailedTryRequest()
+
+    def _backoff_wait_time(
+        self,
+        previous_wait: float,
+        response: Union[requests.Response, None],
+        settings: dict = config.TRY_REQUEST_SETTINGS
+    ) -> float:
+        """Computes how long to wait before the next request attempt.
+
+        Honors the server-specified Retry-After when the last response was
+        throttled or the service was unavailable. Otherwise uses
+        decorrelated jitter: a uniform draw between the base wait and three
+        times the previous wait, capped. The waits still grow toward the
+        cap on repeated failures, but successive retries across scripts
+        sharing a throttle bucket stay spread out instead of clustering
+        around fixed exponential steps.
+
+        Parameters
+        ----------
+            previous_wait : float
+                The wait used before the attempt that just failed.
+            response : requests.Response or None
+                The last response, if one was received.
+            settings : dict
+
+        Returns
+        -------
+            float
+        """
+        if response is not None and response.status_code in (429, 503):
+            try:
+                return float(response.headers.get('Retry-After', ""))
+            except ValueError:
+                pass
+        return min(
+            settings['max_wait_before_next_attempt'],
+            random.uniform(
+                settings['wait_before_next_attempt'], previous_wait * 3
+            )
+        )
+
+    def _resolve_resource_url(self, resource_path: str) -> str:
+        """Returns the full URL for a server-returned href.
+
+        Responsys normally returns resource paths relative to the obtained
+        endpoint; an absolute href is passed through untouched.
+
+        Parameters
+        ----------
+            resource_path : str
+
+        Returns
+        -------
+            str
+        """
+        if resource_path.startswith("http"):
+            return resource_path
+        return self._obtained_url + resource_path
+
+    def _fetch_a_streamed_page(
+        self, url: str, params: Union[dict, None]
+    ) -> dict:
+        """Requests one page with stream=True and parses its JSON body.
+
+        Parameters
+        ----------
+            url : str
+            params : dict or None
+                Query parameters for the first page; None when the url came
+                from a next href, which already carries the query.
+
+        Returns
+        -------
+            dict
+        """
+        response = self._try_request(
+            function=self._http.get,
+            timeout=self._request_timeout,
+            url=url,
+            params=params,
+            stream=True
+        )
+        return self._read_json(response)
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Generating batch of campaigns"
+    )
+    def _campaign_batch_generator(
+        self,
+        limit: int = config.DEFAULT_PAGE_LIMIT, offset: int = 0,
+        campaign_type: str = "email"
+    ) -> Generator:
+        """Retrieves the next batch of campaigns with each iteration.
+
+        While the consumer processes one page, the request for the
+        following page is already in flight on a background thread, hiding
+        one round trip per page.
+
+        Parameters
+        ----------
+            offset : int
+            limit : int
+            campaign_type : str
+
+        Yields
+        -------
+            dict
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        ) as executor:
+            in_flight = executor.submit(
+                self._fetch_a_streamed_page,
+                self._endpoint_urls['campaigns'],
+                {'limit': limit, 'offset': offset, 'type': campaign_type}
+            )
+            while in_flight is not None:
+                response_json = in_flight.result()
+                in_flight = None
+                # A short page is the last one; skip the speculative
+                # request for a next page that would only come back empty.
+                if len(response_json['campaigns']) == limit:
+                    resource_path: str = self._get_next_resource_path(
+                        response_json
+                    )
+                    if resource_path != "":
+                        # Overlap the next page's round trip with the
+                        # consumer's processing of this one. Pages after
+                        # the first carry their query in the next href.
+                        in_flight = executor.submit(
+                            self._fetch_a_streamed_page,
+                            self._resolve_resource_url(resource_path),
+                            None
+                        )
+                yield response_json
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Generating a batch of programs"
+    )
+    def _program_batch_generator(
+        self,
+        limit: int = config.DEFAULT_PAGE_LIMIT, offset: int = 0,
+        status: str = ""
+    ) -> Generator:
+        """Retrieves the next batch of programs with each iteration.
+
+        While the consumer processes one page, the request for the
+        following page is already in flight on a background thread, hiding
+        one round trip per page.
+
+        Parameters
+        ----------
+            limit : int
+            offset : int
+            status : str
+
+        Yields
+        -------
+            dict
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        ) as executor:
+            in_flight = executor.submit(
+                self._fetch_a_streamed_page,
+                self._endpoint_urls['programs'],
+                {'limit': limit, 'offset': offset, 'status': status}
+            )
+            while in_flight is not None:
+                response_json = in_flight.result()
+                in_flight = None
+                # A short page is the last one; skip the speculative
+                # request for a next page that would only come back empty.
+                if len(response_json['programs']) == limit:
+                    resource_path: str = self._get_next_resource_path(
+                        response_json
+                    )
+                    if resource_path != "":
+                        # Overlap the next page's round trip with the
+                        # consumer's processing of this one. Pages after
+                        # the first carry their query in the next href.
+                        in_flight = executor.submit(
+                            self._fetch_a_streamed_page,
+                            self._resolve_resource_url(resource_path),
+                            None
+                        )
+                yield response_json
+
+    def _fetch_a_page(
+        self,
+        object_type: str, limit: int, offset: int, extra_params: dict
+    ) -> dict:
+        """Retrieves one page of campaigns or programs.
+
+        Parameters
+        ----------
+            object_type : str
+                The options are "campaigns" or "programs".
+            limit : int
+            offset : int
+            extra_params : dict
+                Additional query parameters, e.g. type or status.
+
+        Returns
+        -------
+            dict
+        """
+        response = self._try_request(
+            function=self._http.get,
+            timeout=self._request_timeout,
+            url=self._endpoint_urls[object_type],
+            params={'limit': limit, 'offset': offset, **extra_params},
+            stream=True
+        )
+        return self._read_json(response)
+
+    @utils.log_wrap(
+        logging_func=logging.info,
+        before_msg="Begin fetching pages concurrently",
+        after_msg="Finished fetching pages concurrently"
+    )
+    def _fetch_all_concurrently(
+        self,
+        object_type: str, extra_params: dict, max_workers: int,
+        limit: int = config.DEFAULT_PAGE_LIMIT,
+        projection: Union[list, None] = None
+    ) -> dict:
+        """Fetches every page of campaigns or programs with worker threads.
+
+        The first page is fetched on its own. The remaining pages are then
+        requested in waves of max_workers offsets at a time, since the
+        offsets after the first page are independent of each other. The
+        wall-clock time spent is roughly that of the slowest page in each
+        wave instead of the sum of every round trip.
+
+        Parameters
+        ----------
+            object_type : str
+                The options are "campaigns" or "programs".
+            extra_params : dict
+                Additional query parameters, e.g. type or status.
+            max_workers : int
+                Number of pages requested at the same time.
+            limit : int
+            projection : list or None
+                Keys kept on each record, applied page by page; 'id' is
+                always retained for the dedupe.
+
+        Returns
+        -------
+            dict
+        """
+        fetched: dict = self._fetch_a_page(
+            object_type=object_type, limit=limit, offset=0,
+            extra_params=extra_params
+        )
+        if projection is not None:
+            self._project_records(object_type, fetched, projection)
+        if self._get_next_resource_path(fetched) == "":
+            return fetched
+        # Keying the accumulator by id dedupes on the fly, so no separate
+        # pass over the merged list is needed afterwards.
+        objects_by_id: dict = {
+            object['id']: object for object in fetched[object_type]
+        }
+        offset: int = limit
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            while True:
+                futures: list = [
+                    executor.submit(
+                        self._fetch_a_page,
+                        object_type, limit, page_offset, extra_params
+                    )
+                    for page_offset in range(
+                        offset, offset + limit*max_workers, limit
+                    )
+                ]
+                last_wave: bool = False
+                for future in futures:
+                    page: dict = future.result()
+                    if projection is not None:
+                        self._project_records(object_type, page, projection)
+                    objects_by_id.update(
+                        (object['id'], object)
+                        for object in page[object_type]
+                    )
+                    fetched['links'] += page['links']
+                    if len(page[object_type]) < limit:
+                        last_wave = True
+                if last_wave:
+                    break
+                offset += limit*max_workers
+        fetched[object_type] = list(objects_by_id.values())
+        return fetched
+
+    @staticmethod
+    def _project_records(
+        object_type: str, fetched: dict, projection: list
+    ) -> None:
+        """Trims each fetched record in place to only the requested keys.
+
+        Full campaign records carry a few dozen keys; when a caller only
+        needs a handful, dropping the rest page by page keeps the memory
+        held by a complete fetch proportional to the projected width
+        instead of the full record. 'id' is always kept because the
+        cross-page dedupe keys on it.
+
+        Parameters
+        ----------
+            object_type : str
+                The options are "campaigns" or "programs".
+            fetched : dict
+            projection : list
+                Keys to keep on each record.
+        """
+        keys: tuple = tuple(projection)
+        if 'id' not in projection:
+            keys = ('id',) + keys
+        fetched[object_type] = [
+            {key: record.get(key) for key in keys}
+            for record in fetched[object_type]
+        ]
+
+    @staticmethod
+    def _get_next_resource_path(fetched: dict) -> str:
+        """Retrieves next href value from results of a complete fetch all.
+
+        Parameters
+        ----------
+            fetched : dict
+
+        Returns
+        -------
+            str
+        """
+        return next(
+            (
+                link['href'] for link in fetched.get('links', ())
+                if link.get('rel') == 'next'
+            ),
+            ""
+        )
+
+    def _dedupe(self, object_type: str, fetched: dict) -> None:
+        """Drops any duplicate fetched campaigns or programs.
+
+        A single pass with a set of seen ids, keeping the first occurrence
+        of each id in fetch order. The list is mutated in place, so callers
+        holding a reference to it see the deduped result too. The fetch_all
+        methods dedupe while accumulating instead; this remains for callers
+        merging batches by hand.
+
+        Parameters
+        ----------
+            object_type : str
+                The options are "campaigns" or "programs".
+            fetched : dict
+        """
+        seen_ids: set = set()
+        deduped: list = []
+        for object in fetched[object_type]:
+            if object['id'] not in seen_ids:
+                seen_ids.add(object['id'])
+                deduped.append(object)
+        fetched[object_type][:] = deduped
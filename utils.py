@@ -1,6 +1,78 @@
+import functools
 import logging
+import threading
+import time
 from typing import Any, Callable
 
+# Maps logging function names to the numeric level they emit at, so
+# log_wrap can gate on Logger.isEnabledFor without building a record.
+_LOGGING_FUNC_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'warn': logging.WARNING,
+    'error': logging.ERROR,
+    'exception': logging.ERROR,
+    'critical': logging.CRITICAL,
+    'fatal': logging.CRITICAL
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outgoing API requests.
+
+    Each request takes one token; tokens replenish continuously at the
+    configured rate up to the capacity, which bounds how large a burst can
+    leave the client at once. Shared by the worker threads of the
+    concurrent fetch paths.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens replenished per second.
+    capacity : float
+        Maximum tokens held, i.e. the largest allowed burst.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Blocks until the requested tokens are available, then takes them.
+
+        Parameters
+        ----------
+        tokens : float
+            Number of tokens to take.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """Empties the bucket after a throttled response.
+
+        The next request then waits for a full refill interval instead of
+        adding load while the service is already shedding it.
+        """
+        with self._lock:
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
+
 
 def log_wrap(
     logging_func: Callable = logging.info,
@@ -9,24 +81,56 @@ def log_wrap(
 ) -> Any:
     """Wrapper that gives a function a start and end logging message.
 
+    The wrapper body is specialized at decoration time: which messages
+    exist is decided once instead of being re-checked on every call, and
+    the level gate goes through Logger.isEnabledFor, so a disabled level
+    costs one cheap check rather than a discarded log record.
+
     Parameters
     ----------
     logging_func : func
-        Pointer to the logging function intended to be used.
+        Pointer to the logging function intended to be used; either a
+        module-level function like logging.info or a bound logger method.
     before_msg : str
         Message passed to logging before the primary function is called.
     after_msg : str
         Message passed to logging after the primary function is called.
     """
+    # Module-level logging functions emit through the root logger; bound
+    # methods carry their logger on __self__.
+    wrapped_logger = getattr(logging_func, '__self__', logging.getLogger())
+    level = _LOGGING_FUNC_LEVELS.get(logging_func.__name__, logging.INFO)
+
     def decorate(func):
         """ Decorator """
-        def call(*args, **kwargs):
-            """ Actual wrapping """
-            if before_msg != "":
-                logging_func(before_msg)
-            result = func(*args, **kwargs)
-            if after_msg != "":
-                logging_func(after_msg)
-            return result
+        if before_msg != "" and after_msg != "":
+            @functools.wraps(func)
+            def call(*args, **kwargs):
+                """ Actual wrapping """
+                enabled = wrapped_logger.isEnabledFor(level)
+                if enabled:
+                    logging_func(before_msg)
+                result = func(*args, **kwargs)
+                if enabled:
+                    logging_func(after_msg)
+                return result
+        elif before_msg != "":
+            @functools.wraps(func)
+            def call(*args, **kwargs):
+                """ Actual wrapping """
+                if wrapped_logger.isEnabledFor(level):
+                    logging_func(before_msg)
+                return func(*args, **kwargs)
+        elif after_msg != "":
+            @functools.wraps(func)
+            def call(*args, **kwargs):
+                """ Actual wrapping """
+                result = func(*args, **kwargs)
+                if wrapped_logger.isEnabledFor(level):
+                    logging_func(after_msg)
+                return result
+        else:
+            # No messages at all; there is nothing to wrap.
+            return func
         return call
     return decorate